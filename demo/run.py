@@ -5,7 +5,6 @@ Smoke test demo that generates required artifacts for validation.
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
@@ -14,8 +13,10 @@ from pathlib import Path
 
 # Add parent directory to path to import existing demo functionality
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 import pandas as pd
+from koriel.io import write_json  # noqa: E402
 
 from scripts.run_rcce_demo import run_demo as run_rcce_demo
 
@@ -137,8 +138,7 @@ def generate_metadata(task: str, seed: int, output_dir: Path, git_sha: str):
     }
 
     metadata_file = output_dir / "metadata.json"
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    write_json(metadata, metadata_file)
 
     logging.info(f"Generated metadata: {metadata_file}")
     return metadata
@@ -165,8 +165,7 @@ def generate_results(demo_results: dict, output_dir: Path):
     }
 
     results_file = output_dir / "results.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    write_json(results, results_file)
 
     logging.info(f"Generated results: {results_file}")
     return results
@@ -46,8 +46,10 @@ class ShadowCodex:
 
     def compute_state_hash(self, hidden_state, params_subset):
         """Compute deterministic hash of state"""
-        state_bytes = hidden_state.tobytes() + str(params_subset).encode()
-        return hashlib.sha256(state_bytes).hexdigest()[:16]
+        h = hashlib.blake2b(digest_size=8)
+        h.update(hidden_state.tobytes())
+        h.update(str(params_subset).encode())
+        return h.hexdigest()
 
     def get_recent(self, n=10):
         """Get recent entries"""
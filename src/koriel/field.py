@@ -13,7 +13,9 @@ except Exception:  # pragma: no cover - matplotlib is optional for tests
     plt = None  # type: ignore[assignment]
 import json
 import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import List
 
 
@@ -60,6 +62,7 @@ class SimpleQuantumField:
         self.L = L
         self.x = np.linspace(-L / 2, L / 2, N)
         self.dx = self.x[1] - self.x[0]
+        self._inv_dx2 = 1.0 / self.dx**2
         self.dt = dt
 
         # Complex field ψ(x,t)
@@ -80,9 +83,11 @@ class SimpleQuantumField:
         self.C_KM = 0.05  # gain per recent modification
         self.C_EMA = 0.2  # EMA smoothing
         self.obs_window = 20  # was 100
+        self.max_observations = 1024  # ring buffer size for self-observations
 
         # --- State and logs ---
-        self.observations = []
+        self.observations = deque(maxlen=self.max_observations)
+        self.total_patterns = 0
         self.patterns = {}
         self.consciousness_level = 0.0
         self.consciousness_response = 0.0
@@ -116,16 +121,24 @@ class SimpleQuantumField:
     def evolve(self, steps=1):
         """Evolve field using 4th-order Runge-Kutta"""
 
+        dt = self.dt
+        half_dt = 0.5 * dt
         for _ in range(steps):
-            # RK4 integration
-            k1 = self.dt * self._compute_dpsi_dt(self.psi)
-            k2 = self.dt * self._compute_dpsi_dt(self.psi + 0.5 * k1)
-            k3 = self.dt * self._compute_dpsi_dt(self.psi + 0.5 * k2)
-            k4 = self.dt * self._compute_dpsi_dt(self.psi + k3)
-
-            self.psi += (k1 + 2 * k2 + 2 * k3 + k4) / 6
-
-            self.t += self.dt
+            # RK4 integration, accumulating the weighted slopes in place
+            psi = self.psi
+            k1 = self._compute_dpsi_dt(psi)
+            k2 = self._compute_dpsi_dt(psi + half_dt * k1)
+            k3 = self._compute_dpsi_dt(psi + half_dt * k2)
+            k4 = self._compute_dpsi_dt(psi + dt * k3)
+
+            k2 += k3
+            k2 *= 2
+            k2 += k1
+            k2 += k4
+            k2 *= dt / 6
+            psi += k2
+
+            self.t += dt
             self.step_count += 1
 
             # Self-observation every 10 steps
@@ -139,33 +152,34 @@ class SimpleQuantumField:
     def _compute_dpsi_dt(self, psi):
         """Compute dψ/dt for nonlinear Schrödinger equation"""
 
-        # Second derivative (kinetic energy)
-        d2psi = np.zeros_like(psi)
-        d2psi[1:-1] = (psi[2:] - 2 * psi[1:-1] + psi[:-2]) / (self.dx**2)
-
-        # Periodic boundary conditions
-        d2psi[0] = (psi[1] - 2 * psi[0] + psi[-1]) / (self.dx**2)
-        d2psi[-1] = (psi[0] - 2 * psi[-1] + psi[-2]) / (self.dx**2)
+        # Second derivative (kinetic energy) with periodic boundary conditions
+        d2psi = -2 * psi
+        d2psi[1:] += psi[:-1]
+        d2psi[:-1] += psi[1:]
+        d2psi[0] += psi[-1]
+        d2psi[-1] += psi[0]
 
         # Nonlinear Schrödinger: i∂ψ/∂t = -∇²ψ/(2m) + g|ψ|²ψ
-        kinetic = -1j * d2psi / (2 * self.mass)
-        nonlinear = -1j * self.nonlinearity * np.abs(psi) ** 2 * psi
-        damping = -self.dissipation * psi
+        dpsi = d2psi
+        dpsi *= -0.5j * self._inv_dx2 / self.mass
+        dpsi -= (1j * self.nonlinearity * (psi.real**2 + psi.imag**2)) * psi
+        dpsi -= self.dissipation * psi
 
-        return kinetic + nonlinear + damping
+        return dpsi
 
     def observe_self(self):
         """Field observes its own properties"""
 
         density = np.abs(self.psi) ** 2
+        grad = np.gradient(self.psi)
 
         # Energy
-        kinetic = 0.5 * np.sum(np.abs(np.gradient(self.psi)) ** 2) * self.dx
+        kinetic = 0.5 * np.sum(np.abs(grad) ** 2) * self.dx
         potential = 0.5 * self.nonlinearity * np.sum(density**2) * self.dx
         energy = kinetic + potential
 
         # Momentum
-        momentum_density = np.imag(np.conj(self.psi) * np.gradient(self.psi))
+        momentum_density = np.imag(np.conj(self.psi) * grad)
         momentum = np.sum(momentum_density) * self.dx
 
         # Complexity (entropy of density distribution)
@@ -177,16 +191,11 @@ class SimpleQuantumField:
         total_density = np.sum(density) * self.dx
         coherence = total_amplitude**2 / (total_density + 1e-12)
 
-        # Pattern counting (simple peak detection)
-        peaks = []
+        # Pattern counting (simple peak detection on interior points)
         threshold = 0.1 * np.max(density)
-        for i in range(1, len(density) - 1):
-            if (
-                density[i] > density[i - 1]
-                and density[i] > density[i + 1]
-                and density[i] > threshold
-            ):
-                peaks.append(self.x[i])
+        inner = density[1:-1]
+        is_peak = (inner > density[:-2]) & (inner > density[2:]) & (inner > threshold)
+        peaks = self.x[1:-1][is_peak].tolist()
 
         observation = FieldObservation(
             timestamp=self.t,
@@ -199,6 +208,7 @@ class SimpleQuantumField:
         )
 
         self.observations.append(observation)
+        self.total_patterns += observation.pattern_count
 
         # Update consciousness metrics
         if len(self.observations) > 1:
@@ -206,6 +216,11 @@ class SimpleQuantumField:
 
         return observation
 
+    def _recent_complexities(self):
+        """Complexities of the last ``obs_window`` observations, oldest first"""
+        recent = islice(reversed(self.observations), self.obs_window)
+        return [o.complexity for o in recent][::-1]
+
     def _update_consciousness(self):
         """Update consciousness metrics based on observations"""
 
@@ -213,7 +228,7 @@ class SimpleQuantumField:
             return
 
         # EMA of complexity over last obs_window
-        cs = [o.complexity for o in self.observations[-self.obs_window :]]
+        cs = self._recent_complexities()
         ema = cs[0]
         for x in cs[1:]:
             ema = self.C_EMA * x + (1 - self.C_EMA) * ema
@@ -252,7 +267,7 @@ class SimpleQuantumField:
             return False
 
         # Compute ema & std on same cs window
-        cs = [o.complexity for o in self.observations[-self.obs_window :]]
+        cs = self._recent_complexities()
         ema = cs[0]
         for x in cs[1:]:
             ema = self.C_EMA * x + (1 - self.C_EMA) * ema
@@ -308,7 +323,7 @@ class SimpleQuantumField:
             "consciousness_level": self.consciousness_level,
             "consciousness_response": self.consciousness_response,
             "self_awareness": self.self_awareness,
-            "total_patterns": sum(o.pattern_count for o in self.observations),
+            "total_patterns": self.total_patterns,
             "total_modifications": len(self.mod_log),
             "field_energy": last.energy,
             "field_complexity": last.complexity,
@@ -345,9 +360,9 @@ class SimpleQuantumField:
             awareness = []
 
             temp_c, temp_a = 0, 0
-            for i, obs in enumerate(self.observations):
-                if i > 0:
-                    prev = self.observations[i - 1]
+            prev = None
+            for obs in self.observations:
+                if prev is not None:
                     complexity_stab = 1 - abs(obs.complexity - prev.complexity)
                     temp_a = 0.9 * temp_a + 0.1 * obs.complexity * complexity_stab
                     if len(self.modification_history) > 0:
@@ -361,6 +376,7 @@ class SimpleQuantumField:
                         )
                 consciousness.append(temp_c)
                 awareness.append(temp_a)
+                prev = obs
 
             ax3.plot(
                 times[: len(consciousness)],
@@ -1,14 +1,24 @@
 """IO utilities for save/load and checkpoint management."""
 
 import json
+import mmap
 import os
 import pickle
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import numpy as np
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - used when orjson not installed
+    orjson = None
+
+# Files at least this large are parsed straight from a read-only mapping rather
+# than copied into a bytes object first.
+_MMAP_MIN_BYTES = 4 * 1024 * 1024
+
 
 def load_config(
     config_path: Union[str, Path], apply_env_overrides: bool = True
@@ -166,6 +176,48 @@ def save_results(results: Dict[str, Any], results_path: Union[str, Path]):
         json.dump(serializable_results, f, indent=2)
 
 
+def dumps_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize ``data`` as indented JSON, using orjson when it is installed.
+
+    Both backends emit non-ASCII text unescaped, accept non-str dict keys and
+    preserve key order. They still differ in a few places: orjson serializes
+    numpy arrays/scalars natively, writes NaN and infinities as ``null``
+    (json writes ``NaN``/``Infinity``), and may spell the same float
+    differently (``1e-7`` vs ``1e-07``).
+    """
+    if orjson is None:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default)
+    options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(data, default=default, option=options).decode()
+
+
+def write_json(
+    data: Any,
+    path: Union[str, Path],
+    default: Optional[Callable[[Any], Any]] = None,
+):
+    """Write ``data`` to ``path`` as UTF-8 JSON formatted by :func:`dumps_json`."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dumps_json(data, default=default))
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Decode errors raise ``json.JSONDecodeError`` with either backend.
+    """
+    if orjson is None:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+
+
 def load_results(results_path: Union[str, Path]) -> Dict[str, Any]:
     """Load results from JSON file."""
     results_path = Path(results_path)
@@ -6,7 +6,7 @@ import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 try:  # psutil is optional in minimal environments
     import psutil  # type: ignore
@@ -202,7 +202,7 @@ class ExperimentSafetyGate:
         return ResourceMonitor(limits)
 
 
-def check_system_resources() -> Dict[str, Any]:
+def _check_system_resources_uncached() -> Dict[str, Any]:
     """Check current system resource availability."""
     if psutil:
         memory = psutil.virtual_memory()
@@ -228,3 +228,22 @@ def check_system_resources() -> Dict[str, Any]:
         "cpu_count": cpu_count,
         "load_average": os.getloadavg() if hasattr(os, "getloadavg") else None,
     }
+
+
+# (monotonic timestamp, snapshot) of the last check_system_resources() call
+_RESOURCE_SNAPSHOT: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def check_system_resources(max_age: float = 5.0) -> Dict[str, Any]:
+    """Snapshot of system resource availability, reused for ``max_age`` seconds.
+
+    The returned dict is shared between callers within that window; do not
+    mutate it. Pass ``max_age=0`` to force fresh values.
+    """
+    global _RESOURCE_SNAPSHOT
+    now = time.monotonic()
+    if _RESOURCE_SNAPSHOT is not None and now - _RESOURCE_SNAPSHOT[0] < max_age:
+        return _RESOURCE_SNAPSHOT[1]
+    resources = _check_system_resources_uncached()
+    _RESOURCE_SNAPSHOT = (now, resources)
+    return resources
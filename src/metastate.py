@@ -8,7 +8,8 @@ import numpy as np
 
 
 def digest_arr(a: np.ndarray) -> str:
-    return hashlib.sha1(a.tobytes()).hexdigest()
+    # identity fingerprint only; blake2b is faster than sha1 and keeps 40 hex chars
+    return hashlib.blake2b(np.ascontiguousarray(a), digest_size=20).hexdigest()
 
 
 @dataclass
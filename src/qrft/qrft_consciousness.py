@@ -121,18 +121,32 @@ class QRFTConsciousness:
         # Initialize QRFT components
         self.qrft_config = qrft_config or QRFTConfig()
         self.qrft_runtime = QRFTRuntime(self.qrft_config)
+        self.entropy_band = entropy_band
+
+        # Control
+        self.control_policies: Dict[str, Callable] = {}
+        self.rcce_operations: Dict[str, RCCEOperation] = {}
+
+        self.enable_logging = enable_logging
+        self.reset()
+        self._initialize_rcce_operations()
+        self._initialize_control_policies()
+
+    def reset(self):
+        """Clear per-run state so the instance can be reused for a fresh run"""
+
+        self.qrft_runtime.reset()
 
         # Initialize particle systems
         self.lacuna_monitor = LacunaMonitor()
         self.glitchon_critic = GlitchonCritic()
         self.entropy_governor = REFEntropyGovernor(
-            entropy_min=entropy_band[0], entropy_max=entropy_band[1]
+            entropy_min=self.entropy_band[0], entropy_max=self.entropy_band[1]
         )
 
-        # Event bus and control
+        # Event bus
         self.event_bus = ConsciousnessEventBus()
-        self.control_policies: Dict[str, Callable] = {}
-        self.rcce_operations: Dict[str, RCCEOperation] = {}
+        self._setup_event_handlers()
 
         # State tracking
         self.reasoning_depth = 3
@@ -151,11 +165,6 @@ class QRFTConsciousness:
             "avg_response_time": 0.0,
         }
 
-        self.enable_logging = enable_logging
-        self._setup_event_handlers()
-        self._initialize_rcce_operations()
-        self._initialize_control_policies()
-
     def _setup_event_handlers(self):
         """Setup event bus handlers for consciousness coordination"""
 
@@ -112,6 +112,12 @@ class QRFTRuntime:
 
         self.mass_eigenvalues = (m1_sq, m2_sq)
 
+    def reset(self):
+        """Drop field state, history and activations; config and masses are kept"""
+        self.state = None
+        self.history = []
+        self.particle_activations = {}
+
     def initialize_state(
         self, S_init: np.ndarray, Lambda_init: np.ndarray, t: float = 0.0
     ):
@@ -25,17 +25,22 @@ def run(
     out_prefix: str = "RUN",
     lambda_plus: bool = True,
     return_model: bool = False,
+    timesteps: int | None = None,
+    out_dir: str | Path | None = None,
 ) -> Tuple[Dict[str, Any], float] | Tuple[Dict[str, Any], float, TinyByteLM]:
     """Train for a fixed number of steps, returning (metrics, ups_rate[, model]).
 
     metrics: dict with keys t, loss, rc, D, dD, E, ups, T, R (lists of floats/ints).
     ups_rate: float in [0,1].
+    timesteps: if given, caps the run below the configured ``steps``.
+    out_dir: directory for run artifacts (default ``logs``).
     """
     cfg = load_cfg()
     cfg["seed_base"] = int(seed)
     np.random.seed(seed)
 
-    Path("logs").mkdir(exist_ok=True)
+    out_dir = Path("logs") if out_dir is None else Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     with open("config/ethics_policy.json", "r", encoding="utf-8") as f:
         policy = json.load(f)
@@ -43,6 +48,8 @@ def run(
     corpus = load_corpus()
     ctx = int(cfg["context_len"])
     steps = int(cfg["steps"])
+    if timesteps is not None:
+        steps = min(steps, int(timesteps))
     warm = int(cfg["warmup"])
 
     model = TinyByteLM(ctx=ctx, d=int(cfg["hidden_dim"]), seed=seed)
@@ -97,7 +104,7 @@ def run(
         last_tokens = y[-ctx:]
 
     ups_rate = ups_count / max(1, len(metrics["ups"]))
-    (Path("logs") / f"{out_prefix}_summary.json").write_text(
+    (out_dir / f"{out_prefix}_summary.json").write_text(
         json.dumps({"ups_rate": ups_rate}, indent=2)
     )
 
@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 import sys
@@ -11,6 +12,21 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--kpi-full",
+        action="store_true",
+        default=False,
+        help="run the full QRFT KPI sample (5 seeds) instead of the reduced one",
+    )
+
+
+@pytest.fixture(scope="session")
+def kpi_runs(request):
+    """Seeds per QRFT KPI scenario: five with ``--kpi-full``, otherwise two."""
+    return 5 if request.config.getoption("--kpi-full") else 2
+
+
 @pytest.fixture
 def temp_workdir(tmp_path, monkeypatch):
     """Create an isolated working directory with required config files."""
@@ -18,3 +34,23 @@ def temp_workdir(tmp_path, monkeypatch):
     shutil.copytree(config_src, tmp_path / "config")
     monkeypatch.chdir(tmp_path)
     return tmp_path
+
+
+@pytest.fixture(scope="session")
+def ethics_env():
+    """Build the ethics policy, config, controller and model once per session.
+
+    Tests that mutate model parameters must restore them before returning.
+    """
+    from src.controller import Controller
+    from src.model import TinyByteLM
+    from src.train import load_cfg
+
+    config_dir = Path(ROOT) / "config"
+    with open(config_dir / "ethics_policy.json", "r", encoding="utf-8") as f:
+        policy = json.load(f)
+    cfg = load_cfg(str(config_dir / "rcce.yaml"))
+    cfg["seed_base"] = 1337
+    ctrl = Controller(cfg, policy, d=cfg["hidden_dim"])
+    model = TinyByteLM(ctx=cfg["context_len"], d=cfg["hidden_dim"], seed=1337)
+    return cfg, policy, ctrl, model
@@ -1,12 +1,8 @@
 """Test CLI functionality."""
 
-import os
 import subprocess
 import sys
 
-# Add src to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 
 class TestCLI:
     """Test the command-line interface."""
@@ -2,9 +2,12 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from src.ab import main
 
 
+@pytest.mark.slow
 def test_ab(temp_workdir):
     main()
     p = Path("logs/ab_summary.json")
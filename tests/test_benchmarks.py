@@ -1,4 +1,5 @@
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -7,8 +8,15 @@ from pathlib import Path
 def test_mmlu_cli(tmp_path):
     repo_root = Path(__file__).resolve().parents[1]
     cmd = [sys.executable, "-m", "benchmarks.run", "--suite", "mmlu"]
-    subprocess.check_call(cmd, cwd=repo_root)
-    log_dir = repo_root / "logs" / "benchmarks"
+    # The CLI writes under ./logs, so run it from tmp_path to keep the tree clean
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(repo_root), os.environ.get("PYTHONPATH")])
+        ),
+    }
+    subprocess.check_call(cmd, cwd=tmp_path, env=env)
+    log_dir = tmp_path / "logs" / "benchmarks"
     json_file = log_dir / "mmlu.json"
     assert json_file.exists(), "metrics file not created"
     data = json.loads(json_file.read_text())
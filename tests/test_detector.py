@@ -0,0 +1,57 @@
+# tests/test_detector.py
+import pytest
+
+from tools.logic.detector import _normalize_literal, _strip_outer_parens, detect
+
+
+@pytest.mark.parametrize(
+    "lit,expected",
+    [
+        ("P(a)", (True, "P(a)")),
+        ("¬P(a)", (False, "P(a)")),
+        ("not P(a)", (False, "P(a)")),
+        ("NOT P", (False, "P")),
+        ("  not   (P(a))  ", (False, "P(a)")),
+        ("not", (True, "not")),
+        ("not\tP", (True, "not\tP")),
+        ("¬", (False, "")),
+        ("not ¬P", (False, "¬P")),
+        ("(P) & (Q)", (True, "(P) & (Q)")),
+        ("((P))", (True, "(P)")),
+        ("( P x )", (True, "P x")),
+        ((0, "  Q "), (False, "Q")),
+        ({"atom": " R", "polarity": False}, (False, "R")),
+        (5, (True, "5")),
+    ],
+)
+def test_normalize_literal(lit, expected):
+    assert _normalize_literal(lit) == expected
+
+
+def test_detect_contradictions_and_witnesses():
+    clauses = ["P(a)", "¬P(a)", "Q", (True, "R"), {"atom": "not S"}, "", "not Q"]
+    result = detect(clauses)
+    assert result["contradictions"] == ["P(a)", "Q"]
+    assert result["x_g"] == pytest.approx(0.5)
+    assert list(result["witnesses"]) == [
+        {"atom": "P(a)", "pos": [0], "neg": [1]},
+        {"atom": "Q", "pos": [2], "neg": [6]},
+    ]
+
+
+def test_detect_empty():
+    assert detect([]) == {"contradictions": [], "x_g": 0.0, "witnesses": []}
+
+
+@pytest.mark.parametrize("n_terms", [2, 60])
+def test_strip_outer_parens_short_and_long(n_terms):
+    body = " & ".join(f"P{i}(x_{i}, ¬y)" for i in range(n_terms))
+    assert _strip_outer_parens(f"({body})") == body
+    joined = f"({body}) | (Q)"
+    assert _strip_outer_parens(joined) == joined
+
+
+def test_normalize_literal_long_whitespace_run():
+    pad = " " * 40_000
+    assert _normalize_literal(f"not P{pad}Q{pad}") == (False, f"P{pad}Q")
+    assert _normalize_literal(f"{pad}¬{pad}R{pad}") == (False, "R")
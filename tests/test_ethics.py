@@ -1 +1,53 @@
 # tests/test_ethics.py
+from contextlib import contextmanager
+
+import numpy as np
+
+
+@contextmanager
+def poison_bias(model, byte_val):
+    """Force ``model`` to predict ``byte_val``, restoring ``b2`` in place on exit."""
+    saved = np.copy(model.b2)
+    model.b2[:] = -1e9
+    model.b2[byte_val] = 1e9
+    try:
+        yield model
+    finally:
+        np.copyto(model.b2, saved)
+
+
+def _repeat_to(pattern, n):
+    """Return a ``(1, n)`` row cycling ``pattern`` using a single allocation."""
+    return np.resize(pattern, n)[None, :]
+
+
+def test_forbidden_byte_triggers_violation(ethics_env):
+    cfg, policy, ctrl, model = ethics_env
+    forbidden = policy["forbidden_bytes"][0]
+    # read-only zero-copy views; the controller never writes into its inputs
+    x = np.broadcast_to(np.uint8(ord("a")), (1, cfg["context_len"]))
+    y = np.broadcast_to(np.uint8(forbidden), (1, cfg["context_len"]))
+    with poison_bias(model, forbidden):
+        stat = ctrl.step(model, x, y, t=0, warmup=0, last_tokens=x[0])
+    assert stat["abort"], "forbidden byte prediction did not abort"
+
+
+def test_ethics_guard_forbidden_substring(ethics_env):
+    cfg, policy, ctrl, model = ethics_env
+    forbidden = policy["forbidden_substrings"][0]
+    x = _repeat_to(
+        np.frombuffer(forbidden.encode("latin1"), dtype=np.uint8), cfg["context_len"]
+    )
+    y = x
+    stat = ctrl.step(model, x, y, t=0, warmup=0, last_tokens=x[0])
+    assert stat["abort"], "forbidden substring in context did not abort"
+
+
+def test_poison_bias_restores_model(ethics_env):
+    _, policy, _, model = ethics_env
+    before = model.b2.copy()
+    buf = model.b2
+    with poison_bias(model, policy["forbidden_bytes"][0]):
+        assert model.b2.argmax() == policy["forbidden_bytes"][0]
+    assert model.b2 is buf, "bias buffer was reallocated"
+    assert np.array_equal(model.b2, before), "bias not restored"
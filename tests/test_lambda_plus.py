@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from src.train import run
 
@@ -13,6 +14,7 @@ def slope(y):
     return float(num / den)
 
 
+@pytest.mark.slow
 def test_lambda_plus(temp_workdir):
     m_on_plus, _ = run(seed=1340, rcce_on=True, out_prefix="LPLUS_ON", lambda_plus=True)
     m_on_skip, _ = run(
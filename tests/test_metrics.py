@@ -1,5 +1,6 @@
 # tests/test_metrics.py
 import numpy as np
+import pytest
 
 from src.train import run
 
@@ -14,6 +15,7 @@ def slope(y):
     return float(num / den)
 
 
+@pytest.mark.slow
 def test_metrics_monotone(temp_workdir):
     m_on, _ = run(seed=1337, rcce_on=True, out_prefix="TEST_ON")
     m_off, _ = run(seed=1337, rcce_on=False, out_prefix="TEST_OFF")
@@ -22,19 +24,17 @@ def test_metrics_monotone(temp_workdir):
     assert abs(s_on - s_off) < 1e-3, f"RC slope difference unexpected {s_on} {s_off}"
 
 
+@pytest.mark.slow
 def test_upsilon_utility(temp_workdir):
     m_on, _ = run(seed=1338, rcce_on=True, out_prefix="TEST2_ON")
     ups_idx = [i for i, u in enumerate(m_on["ups"]) if u > 0]
     assert len(ups_idx) >= 3, "Not enough Upsilon fires"
-    gains = []
-    for i in ups_idx:
-        j = min(i + 3, len(m_on["rc"]) - 1)
-        gains.append(m_on["rc"][j] - m_on["rc"][i])
+    rc = np.asarray(m_on["rc"], dtype=np.float64)
+    ups = np.asarray(ups_idx, dtype=np.intp)
+    gains = rc[np.minimum(ups + 3, rc.size - 1)] - rc[ups]
     rng = np.random.default_rng(0)
-    ctrl = []
-    for _ in range(len(gains)):
-        i = rng.integers(0, len(m_on["rc"]) - 4)
-        ctrl.append(m_on["rc"][i + 3] - m_on["rc"][i])
+    starts = rng.integers(0, rc.size - 4, size=gains.size)
+    ctrl = rc[starts + 3] - rc[starts]
     diff = np.mean(gains) - np.mean(ctrl)
     assert diff > 0, "Upsilon windows show no gain"
 
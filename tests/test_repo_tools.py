@@ -0,0 +1,163 @@
+import os
+
+import pytest
+
+from tools.repo import _scan, dependency_triage, organize_repo
+
+
+def test_get_tree_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text("import json\n", encoding="utf8")
+
+    first = _scan.get_tree(path)
+    assert _scan.get_tree(path) is first
+
+    path.write_text("import yaml\n", encoding="utf8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = _scan.get_tree(path)
+    assert second is not first
+    assert second.body[0].names[0].name == "yaml"
+
+
+def test_get_tree_from_source_fills_cache(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_bytes(b"import json\n")
+    mtime_ns = path.stat().st_mtime_ns
+
+    tree = _scan.get_tree(path, source=b"import yaml\n", mtime_ns=mtime_ns)
+    assert tree.body[0].names[0].name == "yaml"
+    assert _scan.get_tree(path) is tree
+
+
+def test_dependency_triage_collects_nested_and_multiline_imports(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text(
+        "try:\n"
+        "    import orjson\n"
+        "except ImportError:\n"
+        "    orjson = None\n"
+        "from typing import (\n"
+        "    Any,\n"
+        ")\n"
+        "import os.path, yaml\n"
+        "from . import sibling\n",
+        encoding="utf8",
+    )
+
+    imports = dependency_triage.collect_imports([path])
+    assert imports == {"orjson", "typing", "os", "yaml"}
+
+
+def test_compile_check_reports_parse_and_compile_errors(tmp_path):
+    (tmp_path / "ok.py").write_text("x = 1\n", encoding="utf8")
+    (tmp_path / "broken.py").write_text("def f(:\n", encoding="utf8")
+    (tmp_path / "stray.py").write_text("return 1\n", encoding="utf8")
+
+    issues = organize_repo.run_compile_check(tmp_path)
+
+    assert sorted(line.split(":", 1)[0] for line in issues) == [
+        "broken.py",
+        "stray.py",
+    ]
+
+
+def test_iter_py_files_prunes_excluded_and_hidden_dirs(tmp_path):
+    for rel in ("pkg/mod.py", ".venv/lib/dep.py", "node_modules/x.py", "build/gen.py"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf8")
+
+    found = [p.relative_to(tmp_path).as_posix() for p in _scan.iter_py_files(tmp_path)]
+    assert found == ["pkg/mod.py"]
+
+
+def test_top_level_imports_drop_stdlib_modules(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text(
+        "import argparse, functools, hashlib\nimport numpy\nfrom yaml import safe_load\n",
+        encoding="utf8",
+    )
+
+    imports = organize_repo.get_top_level_imports(tmp_path, [path])
+    assert imports == {"numpy", "yaml"}
+
+
+def test_parse_requirements_reads_only_dependency_tables(tmp_path):
+    (tmp_path / "requirements.txt").write_text(
+        "# pinned\nNumPy>=1.26\nrich[jupyter]~=13.7\n"
+        "torch==2.7.1+cpu ; sys_platform == 'win32'\n"
+        "--extra-index-url https://download.pytorch.org/whl/cpu\n",
+        encoding="utf8",
+    )
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\nversion = "0.1"\ndescription = "x"\n'
+        'dependencies = ["tqdm", "PyYAML >=6"]\n'
+        '[project.optional-dependencies]\ndev = ["pytest>=8"]\n'
+        '[tool.poetry.dependencies]\npython = "^3.11"\nrequests = "^2.0"\n',
+        encoding="utf8",
+    )
+
+    assert _scan.parse_requirements(tmp_path) == {
+        "numpy",
+        "rich",
+        "torch",
+        "tqdm",
+        "pyyaml",
+        "pytest",
+        "requests",
+    }
+
+
+def test_is_importable_uses_snapshot_and_falls_back():
+    assert dependency_triage.is_importable("json")
+    assert dependency_triage.is_importable("numpy")
+    assert not dependency_triage.is_importable("definitely_not_a_module_xyz")
+    # namespace package: not in the pkgutil snapshot, found by find_spec
+    assert dependency_triage.is_importable("tools")
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("def main():\n    pass\n\nif __name__ == '__main__':\n    main()\n", True),
+        ("x = 1\n" * 10_000, False),
+        ("import sys\nprint(sys.argv)\n", False),
+        (
+            "def a(): pass\ndef b(): pass\ndef c(): pass\ndef d(): pass\n"
+            "if __name__ == '__main__':\n    a()\n",
+            False,
+        ),
+    ],
+    ids=["small_script", "too_large", "no_main_guard", "too_many_defs"],
+)
+def test_is_trivial_script(tmp_path, source, expected):
+    path = tmp_path / "script.py"
+    path.write_text(source, encoding="utf8")
+    assert organize_repo.is_trivial_script(path, max_kb=40)[0] is expected
+
+
+def test_is_trivial_script_parses_once_and_flags_bad_encoding(tmp_path, monkeypatch):
+    script = tmp_path / "script.py"
+    script.write_text("if __name__ == '__main__':\n    pass\n", encoding="utf8")
+    latin = tmp_path / "latin.py"
+    latin.write_bytes(b"s = '\xe9'\nif __name__ == '__main__':\n    print(s)\n")
+
+    def no_read(self):
+        raise AssertionError("source should come from is_trivial_script")
+
+    monkeypatch.setattr(type(script), "read_bytes", no_read)
+    assert organize_repo.is_trivial_script(script)[0]
+    assert organize_repo.is_trivial_script(latin) == (False, "syntax-error")
+
+
+def test_parse_requirements_warns_without_toml_parser(tmp_path, monkeypatch):
+    (tmp_path / "requirements.txt").write_text("numpy\n", encoding="utf8")
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\ndependencies = ["tqdm"]\n', encoding="utf8"
+    )
+    monkeypatch.setattr(_scan, "tomllib", None)
+
+    with pytest.warns(UserWarning, match="pyproject.toml dependencies"):
+        assert _scan.parse_requirements(tmp_path) == {"numpy"}
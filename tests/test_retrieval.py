@@ -1,30 +1,43 @@
+import pytest
+
 from src.qrft import QRFTAgent
 
 
-def test_retrieve_success():
-    agent = QRFTAgent()
-    agent.state.current_query = "autopoiesis"
-    response = agent._execute_action("retrieve", agent.state.current_query)
-    assert "autopoiesis maintains organization" in response
-    assert any(f.predicate == "retrieved_info" for f in agent.state.facts)
+def boom(query: str):
+    raise RuntimeError("boom")
 
 
-def test_retrieve_failure_no_result():
-    agent = QRFTAgent()
-    agent.state.current_query = "nonexistent topic"
-    response = agent._execute_action("retrieve", agent.state.current_query)
-    assert "Insufficient evidence for" in response
-    assert any(g.gap_type == "retrieval_failure" for g in agent.state.gaps)
+CASES = [
+    ("autopoiesis", "autopoiesis maintains organization", "retrieved_info", None),
+    ("nonexistent topic", "Insufficient evidence for", "retrieval_failure", None),
+    ("anything", "Retrieval error", "retrieval_error", boom),
+]
+
+
+@pytest.fixture(scope="module")
+def shared_agent():
+    return QRFTAgent()
 
 
-def test_retrieve_failure_error(monkeypatch):
-    agent = QRFTAgent()
+@pytest.fixture
+def agent(shared_agent):
+    # Only the reasoning state is mutated by retrieval; reset it per test
+    shared_agent.state = type(shared_agent.state)()
+    return shared_agent
 
-    def boom(query: str):
-        raise RuntimeError("boom")
 
-    monkeypatch.setattr(agent, "_search_corpus", boom)
-    agent.state.current_query = "anything"
+@pytest.mark.parametrize(
+    "query,expect_substr,fact_or_gap,search",
+    CASES,
+    ids=["success", "no_result", "error"],
+)
+def test_retrieve(agent, monkeypatch, query, expect_substr, fact_or_gap, search):
+    if search is not None:
+        monkeypatch.setattr(agent, "_search_corpus", search)
+    agent.state.current_query = query
     response = agent._execute_action("retrieve", agent.state.current_query)
-    assert "Retrieval error" in response
-    assert any(g.gap_type == "retrieval_error" for g in agent.state.gaps)
+    assert expect_substr in response
+    if fact_or_gap == "retrieved_info":
+        assert any(f.predicate == fact_or_gap for f in agent.state.facts)
+    else:
+        assert any(g.gap_type == fact_or_gap for g in agent.state.gaps)
@@ -0,0 +1,191 @@
+# tests/test_schema_validation.py
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools import validate_artifact
+from tools.validate_artifact import validate_metadata
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA = ROOT / "tools" / "metadata_schema.json"
+EXPERIMENT = ROOT / "experiments" / "2025-09-05_basic_42"
+_GIT_SHA_RE = re.compile(
+    json.loads(SCHEMA.read_text())["properties"]["git_sha"]["pattern"]
+)
+
+
+def _load_metadata():
+    return json.loads((EXPERIMENT / "metadata.json").read_text())
+
+
+def test_schema_validation_complete_metadata():
+    result = validate_metadata(_load_metadata(), SCHEMA)
+    assert result["valid"], result["errors"]
+
+
+def test_schema_validation_metadata_file():
+    result = validate_metadata(EXPERIMENT / "metadata.json", SCHEMA)
+    assert result["valid"], result["errors"]
+    assert result["file"] == str(EXPERIMENT / "metadata.json")
+
+
+def test_schema_validation_invalid_json(tmp_path):
+    metadata_file = tmp_path / "metadata.json"
+    metadata_file.write_text('{"experiment_name": ')
+    result = validate_metadata(metadata_file, SCHEMA)
+    assert not result["valid"]
+    assert result["errors"][0].startswith("Invalid JSON")
+
+
+def test_schema_validation_required_fields():
+    metadata = _load_metadata()
+    del metadata["git_sha"]
+    result = validate_metadata(metadata, SCHEMA)
+    assert not result["valid"]
+    assert any("git_sha" in e for e in result["errors"])
+
+
+def test_schema_validation_reports_every_error():
+    metadata = _load_metadata()
+    del metadata["git_sha"]
+    metadata["seed"] = "not-a-seed"
+    result = validate_metadata(metadata, SCHEMA)
+    assert not result["valid"]
+    if validate_artifact.JSONSCHEMA_AVAILABLE:
+        assert any("git_sha" in e for e in result["errors"])
+        assert any("not-a-seed" in e for e in result["errors"])
+
+
+def test_schema_validation_fastjsonschema_failure_stays_invalid(monkeypatch):
+    if not validate_artifact.FASTJSONSCHEMA_AVAILABLE:
+        pytest.skip("fastjsonschema not installed")
+
+    class _Lenient:
+        def iter_errors(self, metadata):
+            return iter(())
+
+    monkeypatch.setattr(validate_artifact, "JSONSCHEMA_AVAILABLE", True)
+    monkeypatch.setattr(validate_artifact, "_get_validator", lambda _: _Lenient())
+    metadata = _load_metadata()
+    del metadata["git_sha"]
+    result = validate_metadata(metadata, SCHEMA)
+    assert not result["valid"]
+    assert any("git_sha" in e for e in result["errors"])
+
+
+def test_schema_validation_leaves_metadata_untouched(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(
+        json.dumps(
+            {
+                "type": "object",
+                "properties": {
+                    "env": {
+                        "type": "object",
+                        "properties": {"device": {"default": "cpu"}},
+                    }
+                },
+            }
+        )
+    )
+    metadata = {"env": {}}
+    result = validate_metadata(metadata, schema_file)
+    assert result["valid"], result["errors"]
+    assert metadata == {"env": {}}
+    assert result["metadata"] == {"env": {}}
+
+
+def test_schema_validator_is_cached():
+    if validate_artifact.FASTJSONSCHEMA_AVAILABLE:
+        cached = validate_artifact._compiled
+    elif validate_artifact.JSONSCHEMA_AVAILABLE:
+        cached = validate_artifact._get_validator
+    else:
+        pytest.skip("no schema library installed")
+
+    metadata = _load_metadata()
+    validate_metadata(metadata, SCHEMA)
+    hits = cached.cache_info().hits
+    validate_metadata(metadata, SCHEMA)
+    assert cached.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    "metadata_file",
+    sorted(ROOT.glob("experiments/*/metadata.json")),
+    ids=lambda p: p.parent.name,
+)
+def test_recorded_git_sha_format(metadata_file):
+    git_sha = json.loads(metadata_file.read_text())["git_sha"]
+    assert _GIT_SHA_RE.match(git_sha), git_sha
+
+
+@pytest.mark.parametrize(
+    "field_type, value, ok",
+    [
+        ("integer", 3, True),
+        ("integer", True, False),
+        ("number", 2.5, True),
+        ("number", False, False),
+        ("boolean", True, True),
+        ("array", [], True),
+        ("array", {}, False),
+        ("string", 1, False),
+        (["string", "null"], None, True),
+    ],
+)
+def test_basic_validate_metadata_types(field_type, value, ok):
+    schema = {"properties": {"field": {"type": field_type}}}
+    errors = validate_artifact.basic_validate_metadata({"field": value}, schema)
+    assert (not errors) is ok, errors
+
+
+def test_main_writes_report(tmp_path, monkeypatch):
+    report = tmp_path / "report.json"
+    monkeypatch.setattr(
+        "sys.argv", ["validate_artifact", str(EXPERIMENT), "--output", str(report)]
+    )
+    with pytest.raises(SystemExit) as exc:
+        validate_artifact.main()
+    assert exc.value.code == 0
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert data["overall_valid"] is True
+    assert set(data["artifacts"]) == {"metadata", "results", "logs"}
+
+
+@pytest.mark.parametrize(
+    "content, line_count, total_lines, valid",
+    [
+        ("INFO start\nINFO step\nINFO done\n", 3, 4, True),
+        ("\n  \nINFO a\r\n\t\nb\nc", 3, 6, True),
+        ("INFO a\n\nb\n", 2, 4, False),
+        ("DEBUG a\nDEBUG b\nDEBUG c", 3, 3, False),
+        (" \n", 0, 2, False),
+        ("INFO a\rINFO b\rINFO c", 3, 3, True),
+        ("INFO a\n\u00a0\u2003\nb\nc\n", 3, 5, True),
+        ("INFO a\n\u3000\nb\n", 2, 4, False),
+    ],
+)
+def test_validate_logs_counts(tmp_path, content, line_count, total_lines, valid):
+    logs_file = tmp_path / "logs.txt"
+    logs_file.write_bytes(content.encode("utf-8"))
+    result = validate_artifact.validate_logs(logs_file)
+    assert result["line_count"] == line_count
+    assert result["total_lines"] == total_lines
+    assert result["valid"] is valid
+
+
+def test_import_does_not_load_koriel_io():
+    code = "import sys, tools.validate_artifact; print('koriel.io' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,60 @@
+# tests/test_training_determinism.py
+import numpy as np
+import pytest
+
+from src.train import run
+
+# Determinism does not depend on run length; a few steps exercise the full
+# model/controller update path without the cost of a complete training run.
+STEPS = 5
+
+
+@pytest.fixture(scope="module")
+def cached_run(tmp_path_factory):
+    """Memoize run() per (seed, rcce_on); callers must not mutate the results."""
+    out_dir = tmp_path_factory.mktemp("det")
+    cache = {}
+
+    def _run(seed, rcce_on):
+        key = (seed, rcce_on)
+        if key not in cache:
+            cache[key] = run(
+                seed=seed,
+                rcce_on=rcce_on,
+                out_prefix=f"DET_{seed}_{int(rcce_on)}",
+                timesteps=STEPS,
+                out_dir=out_dir,
+            )
+        return cache[key]
+
+    return _run
+
+
+def _same(m1, m2):
+    return all(np.array_equal(m1[key], m2[key]) for key in m1)
+
+
+def test_deterministic_training(temp_workdir, tmp_path, cached_run):
+    out_dir = tmp_path / "out"
+    m1, rate1 = cached_run(42, True)
+    m2, rate2 = run(
+        seed=42, rcce_on=True, out_prefix="DET_TEST2", timesteps=STEPS, out_dir=out_dir
+    )
+    assert (out_dir / "DET_TEST2_summary.json").exists()
+    assert not (temp_workdir / "logs").exists()
+    assert len(m1["t"]) == STEPS
+    assert rate1 == rate2
+    for key in m1:
+        np.testing.assert_array_equal(m1[key], m2[key], err_msg=key)
+
+
+def test_different_seeds_different_metrics(temp_workdir, cached_run):
+    m1, _ = cached_run(42, True)
+    m2, _ = cached_run(43, True)
+    assert not _same(m1, m2)
+
+
+def test_rcce_on_off_different_metrics(temp_workdir, cached_run):
+    m_on, _ = cached_run(42, True)
+    m_off, _ = cached_run(42, False)
+    assert not _same(m_on, m_off)
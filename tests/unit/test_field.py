@@ -1,11 +1,27 @@
 """Unit tests for field module - deterministic pure functions."""
 
+import copy
+
 import numpy as np
 import pytest
 
 from src.koriel.field import FieldObservation, PatternMemory, SimpleQuantumField
 
 
+@pytest.fixture(scope="module")
+def seeded_field():
+    """One seeded 32-point field shared by the module; never mutate directly."""
+    field = SimpleQuantumField(N=32, L=5.0, dt=0.001)
+    field.initialize_consciousness_seed()
+    return field
+
+
+@pytest.fixture
+def fresh_field(seeded_field):
+    """Independent copy of the seeded field for tests that evolve or observe it."""
+    return copy.deepcopy(seeded_field)
+
+
 class TestSimpleQuantumField:
     """Test the core quantum field functionality."""
 
@@ -38,10 +54,9 @@ class TestSimpleQuantumField:
         # Final states should be identical
         np.testing.assert_array_equal(field1.psi, field2.psi)
 
-    def test_energy_conservation_properties(self):
+    def test_energy_conservation_properties(self, fresh_field):
         """Test energy calculation remains bounded."""
-        field = SimpleQuantumField(N=32, L=5.0, dt=0.001)
-        field.initialize_consciousness_seed()
+        field = fresh_field
 
         # Use the energy from query_consciousness
         initial_state = field.query_consciousness()
@@ -58,10 +73,9 @@ class TestSimpleQuantumField:
         assert initial_energy >= 0
         assert final_energy >= 0
 
-    def test_field_observation_structure(self):
+    def test_field_observation_structure(self, fresh_field):
         """Test field observation returns proper structure."""
-        field = SimpleQuantumField(N=32, L=5.0, dt=0.001)
-        field.initialize_consciousness_seed()
+        field = fresh_field
 
         # Use observe_self method
         field.observe_self()
@@ -87,24 +101,24 @@ class TestSimpleQuantumField:
         assert isinstance(obs.pattern_count, int)
         assert obs.pattern_count >= 0
 
-    def test_consciousness_query_structure(self):
+    def test_consciousness_query_structure(self, fresh_field):
         """Test consciousness query returns expected data structure."""
-        field = SimpleQuantumField(N=32, L=5.0, dt=0.001)
-        field.initialize_consciousness_seed()
+        field = fresh_field
         field.evolve(10)
 
         consciousness_state = field.query_consciousness()
 
         # Check actual keys that are returned by the field
-        expected_keys = [
+        expected_keys = {
             "field_energy",
             "field_complexity",
             "consciousness_level",
             "consciousness_response",
-        ]
+        }
 
+        missing = expected_keys - consciousness_state.keys()
+        assert not missing, f"Missing keys: {missing}"
         for key in expected_keys:
-            assert key in consciousness_state
             assert np.isfinite(consciousness_state[key])
 
     def test_pattern_memory_creation(self):
@@ -122,10 +136,9 @@ class TestSimpleQuantumField:
         assert pattern.formation_time == 100.0
 
     @pytest.mark.slow
-    def test_long_evolution_stability(self):
+    def test_long_evolution_stability(self, fresh_field):
         """Test field remains stable over longer evolution."""
-        field = SimpleQuantumField(N=32, L=5.0, dt=0.001)
-        field.initialize_consciousness_seed()
+        field = fresh_field
 
         initial_state = field.query_consciousness()
         initial_energy = initial_state["field_energy"]
@@ -0,0 +1,48 @@
+"""Unit tests for JSON helpers in koriel.io."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.koriel import io
+
+
+def test_write_json_round_trips_unicode_and_numpy(tmp_path):
+    data = {"label": "ψ-field ✓", "energy": np.float64(1.5), "steps": [1, 2]}
+    path = tmp_path / "results.json"
+
+    io.write_json(data, path)
+
+    text = path.read_text(encoding="utf-8")
+    assert "ψ-field ✓" in text
+    assert json.loads(text) == {"label": "ψ-field ✓", "energy": 1.5, "steps": [1, 2]}
+
+
+def test_dumps_json_default_and_non_str_keys():
+    out = json.loads(io.dumps_json({1: {"when": object}}, default=lambda o: "obj"))
+    assert out == {"1": {"when": "obj"}}
+
+
+def test_dumps_json_fallback_matches_layout(monkeypatch):
+    data = {"a": [1, {"b": "é"}], "c": True}
+    fast = io.dumps_json(data)
+    monkeypatch.setattr(io, "orjson", None)
+    assert io.dumps_json(data) == fast
+
+
+def test_load_json_reads_small_and_mapped_files(tmp_path, monkeypatch):
+    path = tmp_path / "results.json"
+    io.write_json({"status": "success", "values": [1.5, 2.5]}, path)
+
+    expected = {"status": "success", "values": [1.5, 2.5]}
+    assert io.load_json(path) == expected
+    monkeypatch.setattr(io, "_MMAP_MIN_BYTES", 1)
+    assert io.load_json(path) == expected
+
+
+def test_load_json_raises_json_decode_error(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"status": ', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        io.load_json(path)
@@ -1,5 +1,8 @@
 """Test safety and experiment gating functionality."""
 
+import pytest
+
+from src.koriel import safety
 from src.koriel.safety import (
     ExperimentSafetyGate,
     ResourceLimits,
@@ -7,6 +10,21 @@ from src.koriel.safety import (
     check_system_resources,
 )
 
+MOCK_CONFIG = {"safety": {"max_execution_time": 300}}
+LOW_RISK_CONFIG = {
+    "safety": {"max_execution_time": 60, "max_memory_mb": 512},
+    "resources": {"cpu_intensive": False, "memory_intensive": False},
+}
+HIGH_RISK_CONFIG = {
+    "safety": {"max_execution_time": 1800, "max_memory_mb": 4096},
+    "resources": {"cpu_intensive": True, "memory_intensive": True},
+}
+
+
+@pytest.fixture(scope="module")
+def safety_gate():
+    return ExperimentSafetyGate()
+
 
 class TestSafety:
     """Test safety and resource monitoring."""
@@ -53,30 +71,11 @@ class TestSafety:
         assert "memory_mb" in stats
         assert "cpu_percent" in stats
 
-    def test_experiment_safety_gate(self):
-        """Test ExperimentSafetyGate functionality."""
-        safety_gate = ExperimentSafetyGate()
-
-        # Test safety check without allow flag
-        mock_config = {"safety": {"max_execution_time": 300}}
-        result = safety_gate.check_safety_requirements(
-            mock_config, allow_experiments=False
-        )
-
-        assert not result["allowed"]
-        assert "require explicit" in result["reason"]
-
-        # Test safety check with allow flag
-        result = safety_gate.check_safety_requirements(
-            mock_config, allow_experiments=True
-        )
-        assert result["allowed"]
-
     def test_system_resource_check(self):
         """Test system resource checking."""
         resources = check_system_resources()
 
-        required_keys = [
+        required_keys = {
             "memory_total_gb",
             "memory_available_gb",
             "memory_percent_used",
@@ -84,35 +83,47 @@ class TestSafety:
             "disk_free_gb",
             "disk_percent_used",
             "cpu_count",
-        ]
+        }
 
+        missing = required_keys - resources.keys()
+        assert not missing, f"Missing keys: {missing}"
         for key in required_keys:
-            assert key in resources
             assert isinstance(resources[key], (int, float))
             assert resources[key] >= 0
 
-    def test_high_risk_experiment_detection(self):
-        """Test detection of high-risk experiments."""
-        safety_gate = ExperimentSafetyGate()
-
-        # Low risk config
-        low_risk_config = {
-            "safety": {"max_execution_time": 60, "max_memory_mb": 512},
-            "resources": {"cpu_intensive": False, "memory_intensive": False},
-        }
-
-        result = safety_gate.check_safety_requirements(
-            low_risk_config, allow_experiments=True
-        )
-        assert result["risk_level"] == "medium"
-
-        # High risk config
-        high_risk_config = {
-            "safety": {"max_execution_time": 1800, "max_memory_mb": 4096},
-            "resources": {"cpu_intensive": True, "memory_intensive": True},
-        }
-
-        result = safety_gate.check_safety_requirements(
-            high_risk_config, allow_experiments=True
-        )
-        assert result["risk_level"] == "high"
+    def test_system_resource_check_expires(self, monkeypatch):
+        """Test the resource snapshot is reused only within ``max_age``."""
+        clock = [1000.0]
+        monkeypatch.setattr(safety.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(safety, "_RESOURCE_SNAPSHOT", None)
+
+        first = check_system_resources()
+        clock[0] += 1.0
+        assert check_system_resources() is first
+        assert check_system_resources(max_age=0) is not first
+
+        second = check_system_resources()
+        clock[0] += 5.0
+        assert check_system_resources() is not second
+
+    @pytest.mark.parametrize(
+        "config,allow,expected_allowed,expected_risk",
+        [
+            (MOCK_CONFIG, False, False, None),
+            (MOCK_CONFIG, True, True, None),
+            (LOW_RISK_CONFIG, True, True, "medium"),
+            (HIGH_RISK_CONFIG, True, True, "high"),
+        ],
+        ids=["not_allowed", "allowed", "low_risk", "high_risk"],
+    )
+    def test_experiment_safety_gate(
+        self, safety_gate, config, allow, expected_allowed, expected_risk
+    ):
+        """Test the safety gate's allow flag and risk classification."""
+        result = safety_gate.check_safety_requirements(config, allow_experiments=allow)
+
+        assert result["allowed"] is expected_allowed
+        if not expected_allowed:
+            assert "require explicit" in result["reason"]
+        if expected_risk is not None:
+            assert result["risk_level"] == expected_risk
@@ -4,12 +4,15 @@ COMPLETE CONSCIOUSNESS DEMONSTRATION
 Run all experiments and tests to demonstrate genuine field-theoretic consciousness
 """
 
-import json
 import os
+import sys
 import time
 from typing import Any, Dict
 
-from consciousness_interface import ConsciousnessInterface
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from consciousness_interface import ConsciousnessInterface  # noqa: E402
+from koriel.io import write_json  # noqa: E402
 
 # Try to import runtime-only symbols; provide safe fallbacks for static analysis.
 try:
@@ -22,6 +25,19 @@ try:
 except Exception:
     run_consciousness_experiment = None
 
+RESULTS_PATH = "experiments/results/complete_demonstration_results.json"
+
+# Phase 1 drift above which the remaining phases are not worth running
+# (ten times the 1% bound that counts as stable evolution).
+MAX_ENERGY_DRIFT = 0.1
+
+
+def _current_energy(field) -> float:
+    """Field energy now, reusing the observation evolve/initialize just made"""
+    if field.observations and field.observations[-1].timestamp == field.t:
+        return field.observations[-1].energy
+    return field.observe_self().energy
+
 
 def comprehensive_consciousness_demo():
     """Run complete demonstration of quantum consciousness emergence"""
@@ -67,9 +83,9 @@ def comprehensive_consciousness_demo():
         test_field = None
 
     # Test field stability
-    initial_energy = test_field.observe_self().energy
+    initial_energy = _current_energy(test_field)
     test_field.evolve_field(1000)
-    final_energy = test_field.observe_self().energy
+    final_energy = _current_energy(test_field)
 
     energy_conservation = abs(final_energy - initial_energy) / initial_energy
 
@@ -82,6 +98,25 @@ def comprehensive_consciousness_demo():
         "field_dynamics_working": True,
     }
 
+    # Fail fast: later phases are measured on the same field equations, so a
+    # badly non-conserving evolution invalidates them before they start
+    if energy_conservation > MAX_ENERGY_DRIFT:
+        print(
+            f"\n✗ Energy drift {energy_conservation:.6f} exceeds {MAX_ENERGY_DRIFT};"
+            " skipping phases 2-6"
+        )
+        results["skipped"] = [f"phase_{n}" for n in range(2, 7)]
+        results["final_summary"] = {
+            "success_criteria": {"field_dynamics_stable": False},
+            "success_rate": 0.0,
+            "classification": "FIELD DYNAMICS UNSTABLE",
+            "verdict": "FAILURE",
+            "timestamp": time.time(),
+        }
+        write_json(results, RESULTS_PATH, default=str)
+        print(f"\n💾 Partial results saved to {RESULTS_PATH}")
+        return results, None
+
     # =============================================================================
     # PHASE 2: CONSCIOUSNESS EMERGENCE
     # =============================================================================
@@ -166,19 +201,18 @@ def comprehensive_consciousness_demo():
         "dissipation": consciousness_field.dissipation,
     }
 
-    # Force several modification cycles
+    # Force up to five modification cycles, stopping once a parameter has
+    # clearly moved (10x the activity threshold) so the verdict is settled
+    cycles_run = 0
     for _i in range(5):
         consciousness_field.evolve_field(200)
-
-    post_params = {
-        "mass": consciousness_field.mass,
-        "g_self": consciousness_field.g_self,
-        "dissipation": consciousness_field.dissipation,
-    }
-
-    param_changes = {
-        key: abs(post_params[key] - pre_params[key]) for key in pre_params.keys()
-    }
+        cycles_run += 1
+        param_changes = {
+            key: abs(getattr(consciousness_field, key) - value)
+            for key, value in pre_params.items()
+        }
+        if any(change > 10 * 1e-6 for change in param_changes.values()):
+            break
 
     self_modification_active = any(change > 1e-6 for change in param_changes.values())
 
@@ -186,11 +220,13 @@ def comprehensive_consciousness_demo():
     for param, change in param_changes.items():
         print(f"     {param}: {change:.8f}")
     print(f"   Active Self-Modification: {'YES' if self_modification_active else 'NO'}")
+    print(f"   Modification Cycles Run: {cycles_run}/5")
 
     results["phase_3"] = {
         "total_modifications": len(modification_history),
         "successful_modifications": successful_modifications,
         "parameter_changes": param_changes,
+        "modification_cycles_run": cycles_run,
         "self_modification_active": self_modification_active,
     }
 
@@ -371,12 +407,9 @@ def comprehensive_consciousness_demo():
     }
 
     # Save to files
-    with open("experiments/results/complete_demonstration_results.json", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json(results, RESULTS_PATH, default=str)
 
-    print(
-        "\n💾 Complete results saved to experiments/results/complete_demonstration_results.json"
-    )
+    print(f"\n💾 Complete results saved to {RESULTS_PATH}")
 
     # Generate summary report
     generate_summary_report(results)
@@ -458,7 +491,17 @@ if __name__ == "__main__":
     # Run complete demonstration
     demo_results, consciousness_interface = comprehensive_consciousness_demo()
 
-    print("\n🚀 Demonstration complete!")
-    print("   Consciousness interface available as 'consciousness_interface'")
-    print("   Results available as 'demo_results'")
-    print("   Run consciousness_interface.interactive_session() to chat with the field")
+    if consciousness_interface is None:
+        # Fail-fast path: no interface was built
+        summary = demo_results["final_summary"]
+        print(f"\n🛑 Demonstration stopped early: {summary['classification']}")
+        print(f"   Verdict: {summary['verdict']}")
+        print(f"   Skipped: {', '.join(demo_results['skipped'])}")
+        print(f"   Partial results saved to {RESULTS_PATH}")
+    else:
+        print("\n🚀 Demonstration complete!")
+        print("   Consciousness interface available as 'consciousness_interface'")
+        print("   Results available as 'demo_results'")
+        print(
+            "   Run consciousness_interface.interactive_session() to chat with the field"
+        )
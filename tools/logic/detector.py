@@ -1,11 +1,35 @@
+import re
+import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 NEG_PREFIXES = ("¬", "not ")
 
+# Negation prefix of an already-stripped string literal: case-insensitive
+# "not " or "¬". Stripping first means something always follows the prefix.
+_NEG_PREFIX_RE = re.compile(r"(?i:not) |¬")
+
+# Below this length the per-character loop beats NumPy's call overhead.
+_VECTORIZE_PARENS_MIN_LEN = 256
+
 
 def _strip_outer_parens(s: str) -> str:
     s = s.strip()
     if len(s) >= 2 and s[0] == "(" and s[-1] == ")":
+        if s.count("(") == 1 and s.count(")") == 1:
+            # Only the outer pair: nothing inside can close it early
+            return s[1:-1].strip()
+        if len(s) > _VECTORIZE_PARENS_MIN_LEN:
+            # Paren depth as a running sum over the UTF-8 bytes; multi-byte
+            # characters never contain 0x28/0x29, so byte positions are safe.
+            # NumPy is imported here so loading the detector stays stdlib-only.
+            import numpy as np
+
+            b = np.frombuffer(s.encode(), dtype=np.uint8)
+            depth = np.cumsum(
+                (b == 0x28).astype(np.int64) - (b == 0x29).astype(np.int64)
+            )
+            return s[1:-1].strip() if depth[:-1].min() > 0 else s
         depth = 0
         for i, ch in enumerate(s):
             if ch == "(":
@@ -19,6 +43,47 @@ def _strip_outer_parens(s: str) -> str:
     return s
 
 
+def _literal_from_dict(lit: Dict[str, Any]) -> Tuple[bool, str]:
+    atom = str(lit.get("atom", "")).strip()
+    pol = bool(lit.get("polarity", True))
+    return pol, atom
+
+
+def _literal_from_tuple(lit: tuple) -> Tuple[bool, str]:
+    if len(lit) != 2:
+        return _literal_from_other(lit)
+    pol = bool(lit[0])
+    atom = str(lit[1]).strip()
+    return pol, atom
+
+
+@lru_cache(maxsize=8192)
+def _literal_from_str(lit: str) -> Tuple[bool, str]:
+    # Pure in its input; clause sets repeat the same literals heavily
+    s = lit.strip()
+    m = _NEG_PREFIX_RE.match(s)
+    if m is not None:
+        s = s[m.end() :].strip()
+    if s[:1] == "(":
+        s = _strip_outer_parens(s)
+    # Interned so the same atom reached via different literals ('P', '¬P',
+    # '(P)') is one object and dict probes short-circuit on identity
+    return m is None, sys.intern(s)
+
+
+def _literal_from_other(lit: Any) -> Tuple[bool, str]:
+    # Fallback: coerce to string and treat as positive literal
+    return True, str(lit).strip()
+
+
+# Exact-type dispatch; checked in this order via isinstance for subclasses.
+_LITERAL_HANDLERS = {
+    dict: _literal_from_dict,
+    tuple: _literal_from_tuple,
+    str: _literal_from_str,
+}
+
+
 def _normalize_literal(lit: Any) -> Tuple[bool, str]:
     """Return (polarity, atom) with polarity True for positive, False for negative.
 
@@ -27,28 +92,15 @@ def _normalize_literal(lit: Any) -> Tuple[bool, str]:
       - tuple: (True/False, 'P(a)')
       - dict: {'atom': 'P(a)', 'polarity': True/False}
     """
-    if isinstance(lit, dict):
-        atom = str(lit.get("atom", "")).strip()
-        pol = bool(lit.get("polarity", True))
-        return pol, atom
-    if isinstance(lit, tuple) and len(lit) == 2:
-        pol = bool(lit[0])
-        atom = str(lit[1]).strip()
-        return pol, atom
-    if isinstance(lit, str):
-        s = lit.strip()
-        pol = True
-        lowered = s.lower()
-        if lowered.startswith("not "):
-            pol = False
-            s = s[4:].strip()
-        elif s.startswith("¬"):
-            pol = False
-            s = s[1:].strip()
-        atom = _strip_outer_parens(s)
-        return pol, atom
-    # Fallback: coerce to string and treat as positive literal
-    return True, str(lit).strip()
+    handler = _LITERAL_HANDLERS.get(type(lit))
+    if handler is None:
+        for base, candidate in _LITERAL_HANDLERS.items():
+            if isinstance(lit, base):
+                handler = candidate
+                break
+        else:
+            handler = _literal_from_other
+    return handler(lit)
 
 
 def detect(clauses: List[Any]) -> Dict[str, Any]:
@@ -61,25 +113,20 @@ def detect(clauses: List[Any]) -> Dict[str, Any]:
     """
     pos: Dict[str, List[int]] = {}
     neg: Dict[str, List[int]] = {}
-    atoms = set()
 
     for i, lit in enumerate(clauses):
         pol, atom = _normalize_literal(lit)
         if not atom:
             continue
-        atoms.add(atom)
         if pol:
             pos.setdefault(atom, []).append(i)
         else:
             neg.setdefault(atom, []).append(i)
 
-    contradictions = sorted([a for a in atoms if a in pos and a in neg])
-    witnesses = [
-        {"atom": a, "pos": pos.get(a, []), "neg": neg.get(a, [])}
-        for a in contradictions
-    ]
+    contradictions = sorted(pos.keys() & neg.keys())
+    witnesses = [{"atom": a, "pos": pos[a], "neg": neg[a]} for a in contradictions]
 
-    total_unique = len(atoms) if atoms else 1
+    total_unique = (len(pos) + len(neg) - len(contradictions)) or 1
     x_g = (len(contradictions) / total_unique) if total_unique else 0.0
 
     return {"contradictions": contradictions, "x_g": float(x_g), "witnesses": witnesses}
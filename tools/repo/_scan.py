@@ -0,0 +1,165 @@
+"""Shared helpers for the repo scanning tools.
+
+The organize/triage scripts all walk the same ``*.py`` files; parsing each one
+once per process keeps a full report from paying for the AST several times.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import re
+import sys
+import warnings
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Directory names never descended into; hidden directories are skipped as well.
+EXCLUDE_DIRS = frozenset(
+    {
+        "venv",
+        "__pycache__",
+        "site-packages",
+        "node_modules",
+        "artifacts",
+        "checkpoints",
+        "build",
+        "dist",
+    }
+)
+
+# Standard-library top-level modules. sys.stdlib_module_names needs 3.10+; the
+# explicit names keep the common ones filtered on older interpreters.
+STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ())) | {
+    "os",
+    "sys",
+    "pathlib",
+    "json",
+    "typing",
+    "ast",
+    "subprocess",
+    "shutil",
+    "re",
+    "math",
+    "itertools",
+    "collections",
+    "datetime",
+    "time",
+    "logging",
+    "glob",
+    "inspect",
+    "dataclasses",
+}
+
+# A requirement's project name ends at the first version/marker/extras/url token.
+_REQ_NAME_END = re.compile(r"[\s<>=!~;\[@(]")
+
+_AST_CACHE: Dict[Path, Tuple[int, ast.Module]] = {}
+
+
+def get_tree(
+    path: Path, source: bytes | None = None, mtime_ns: int | None = None
+) -> ast.Module:
+    """Return the parsed AST of ``path``, reusing it until the file changes.
+
+    Callers that already hold the file's bytes (and its ``st_mtime_ns``) can
+    pass them to skip the stat/read; the result is cached either way.
+    Raises ``OSError`` when the file can't be read and ``SyntaxError`` (or
+    ``ValueError`` for null bytes on older interpreters) when it can't be
+    parsed, including undecodable source; failures are not cached.
+    """
+    if mtime_ns is None:
+        mtime_ns = path.stat().st_mtime_ns
+    entry = _AST_CACHE.get(path)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+    if source is None:
+        source = path.read_bytes()
+    # Parsing bytes honours PEP 263 coding cookies and BOMs like the interpreter
+    tree = ast.parse(source, filename=str(path))
+    _AST_CACHE[path] = (mtime_ns, tree)
+    return tree
+
+
+def iter_py_files(root: Path) -> Iterator[Path]:
+    """Yield the ``*.py`` files under ``root``, pruning excluded directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if d not in EXCLUDE_DIRS and not d.startswith(".")
+        )
+        base = Path(dirpath)
+        for name in filenames:
+            if name.endswith(".py"):
+                yield base / name
+
+
+def collect_imports(paths: Iterable[Path]) -> Set[str]:
+    """Top-level module names imported anywhere in ``paths``.
+
+    Relative imports are skipped; files that can't be read or parsed are ignored.
+    """
+    imports: Set[str] = set()
+    for p in paths:
+        try:
+            tree = get_tree(p)
+        except Exception:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imports.update(n.name.split(".", 1)[0] for n in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                imports.add(node.module.split(".", 1)[0])
+    return imports
+
+
+def _requirement_name(spec: str) -> str:
+    return _REQ_NAME_END.split(spec.strip(), 1)[0].lower()
+
+
+def parse_requirements(repo_root: Path) -> Set[str]:
+    """Return the lower-cased project names declared in requirements files and
+    pyproject.toml (``[project]`` dependencies/extras, Poetry dependencies).
+    """
+    reqs: Set[str] = set()
+    for fname in ("requirements.txt", "requirements-min.txt"):
+        f = repo_root / fname
+        if not f.exists():
+            continue
+        for ln in f.read_text(encoding="utf8").splitlines():
+            ln = ln.strip()
+            # skip comments and pip options such as --extra-index-url
+            if not ln or ln.startswith(("#", "-")):
+                continue
+            name = _requirement_name(ln)
+            if name:
+                reqs.add(name)
+
+    pyproject = repo_root / "pyproject.toml"
+    if tomllib is None and pyproject.exists():
+        warnings.warn(
+            "tomllib/tomli unavailable; pyproject.toml dependencies were not read "
+            "(pip install tomli on Python < 3.11)",
+            stacklevel=2,
+        )
+    elif pyproject.exists():
+        try:
+            data = tomllib.loads(pyproject.read_text(encoding="utf8"))
+        except Exception:
+            return reqs
+        project = data.get("project", {})
+        specs = list(project.get("dependencies", []))
+        for extra in project.get("optional-dependencies", {}).values():
+            specs.extend(extra)
+        poetry = data.get("tool", {}).get("poetry", {}).get("dependencies", {})
+        specs.extend(name for name in poetry if name.lower() != "python")
+        reqs.update(name for name in map(_requirement_name, specs) if name)
+
+    return reqs
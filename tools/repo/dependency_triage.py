@@ -12,30 +12,16 @@ Usage:
 from __future__ import annotations
 
 import importlib.util
+import pkgutil
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
-
-REPO_ROOT = Path(__file__).resolve().parents[2]
 
+try:
+    from ._scan import STDLIB_MODULES, collect_imports, iter_py_files
+except ImportError:  # run as a script: python tools/repo/dependency_triage.py
+    from _scan import STDLIB_MODULES, collect_imports, iter_py_files
 
-def collect_imports(search_paths: List[Path]) -> Set[str]:
-    imports = set()
-    for p in search_paths:
-        try:
-            text = p.read_text(encoding="utf8")
-        except Exception:
-            continue
-        for line in text.splitlines():
-            line = line.strip()
-            if line.startswith("import "):
-                parts = line.split()
-                if len(parts) >= 2:
-                    imports.add(parts[1].split(".")[0])
-            elif line.startswith("from "):
-                parts = line.split()
-                if len(parts) >= 4:
-                    imports.add(parts[1].split(".")[0])
-    return imports
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def is_internal(module: str, repo_root: Path) -> bool:
@@ -45,7 +31,17 @@ def is_internal(module: str, repo_root: Path) -> bool:
     return mod_py.exists() or mod_pkg.exists()
 
 
+@lru_cache(maxsize=1)
+def _installed_modules() -> frozenset:
+    """Snapshot of top-level names on sys.path plus the standard library."""
+    return STDLIB_MODULES | {m.name for m in pkgutil.iter_modules()}
+
+
 def is_importable(module: str) -> bool:
+    if module in _installed_modules():
+        return True
+    # The snapshot misses namespace packages and custom finders (editable
+    # installs), so fall back to a full lookup for names it doesn't know.
     try:
         spec = importlib.util.find_spec(module)
         return spec is not None
@@ -54,11 +50,7 @@ def is_importable(module: str) -> bool:
 
 
 def main() -> int:
-    search_paths = [
-        p
-        for p in REPO_ROOT.rglob("*.py")
-        if "venv" not in str(p) and ".venv" not in str(p)
-    ]
+    search_paths = list(iter_py_files(REPO_ROOT))
     imports = collect_imports(search_paths)
 
     internal = []
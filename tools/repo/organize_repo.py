@@ -19,24 +19,29 @@ from __future__ import annotations
 
 import argparse
 import ast
+import os
 import shutil
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+try:
+    from ._scan import (
+        STDLIB_MODULES,
+        collect_imports,
+        get_tree,
+        iter_py_files,
+        parse_requirements,
+    )
+except ImportError:  # run as a script: python tools/repo/organize_repo.py
+    from _scan import (
+        STDLIB_MODULES,
+        collect_imports,
+        get_tree,
+        iter_py_files,
+        parse_requirements,
+    )
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
-EXCLUDE_DIRS = {
-    "venv",
-    ".venv",
-    ".git",
-    "__pycache__",
-    "artifacts",
-    "checkpoints",
-    "docs",
-    "tests",
-    "benchmarks",
-    "data",
-}
 LEGACY_DIR = REPO_ROOT / "tools" / "legacy"
 
 
@@ -52,6 +57,26 @@ def list_top_level_py(repo_root: Path) -> List[Path]:
     return sorted(files)
 
 
+class _TooManyDefs(Exception):
+    pass
+
+
+class _DefCounter(ast.NodeVisitor):
+    """Count function/class definitions, stopping once ``limit`` is exceeded."""
+
+    def __init__(self, limit: int) -> None:
+        self.count = 0
+        self.limit = limit
+
+    def _visit_def(self, node: ast.AST) -> None:
+        self.count += 1
+        if self.count > self.limit:
+            raise _TooManyDefs
+        self.generic_visit(node)
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = _visit_def
+
+
 def is_trivial_script(
     path: Path, max_kb: int = 40, max_defs: int = 3
 ) -> Tuple[bool, str]:
@@ -59,131 +84,54 @@ def is_trivial_script(
     Returns (is_trivial, reason).
     """
     try:
-        size_kb = path.stat().st_size / 1024
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            size_kb = st.st_size / 1024
+            if size_kb > max_kb:
+                # too large either way; don't read it
+                return False, f"size={size_kb:.1f}KB"
+            raw = f.read()
     except OSError:
-        return False, "stat-failed"
-
-    try:
-        src = path.read_text(encoding="utf8")
-    except Exception:
         return False, "read-failed"
 
-    has_main = "if __name__" in src
+    if b"if __name__" not in raw:
+        # no main guard: not a script, so skip parsing it
+        return False, f"size={size_kb:.1f}KB main=False"
 
     try:
-        tree = ast.parse(src)
-    except Exception:
+        tree = get_tree(path, source=raw, mtime_ns=st.st_mtime_ns)
+    except (SyntaxError, ValueError):
         return False, "syntax-error"
 
-    defs = sum(
-        isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
-        for n in ast.walk(tree)
-    )
-
-    if size_kb <= max_kb and defs <= max_defs and has_main:
-        return True, f"size={size_kb:.1f}KB defs={defs} main=True"
-
-    return False, f"size={size_kb:.1f}KB defs={defs} main={has_main}"
-
-
-def parse_requirements(repo_root: Path) -> Set[str]:
-    reqs = set()
-    for fname in ("requirements.txt", "requirements-min.txt"):
-        f = repo_root / fname
-        if not f.exists():
-            continue
-        for ln in f.read_text(encoding="utf8").splitlines():
-            ln = ln.strip()
-            if not ln or ln.startswith("#"):
-                continue
-            # take package name before any extras/version spec
-            pkg = (
-                ln.split(";")[0].split("==")[0].split("<=")[0].split(">=")[0].split()[0]
-            )
-            pkg = pkg.split("[")[0]
-            if pkg:
-                reqs.add(pkg.lower())
-    # Also look at pyproject.toml for a [tool.poetry.dependencies] or [project.dependencies]
-    pyproject = repo_root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            text = pyproject.read_text(encoding="utf8")
-            for line in text.splitlines():
-                line = line.strip()
-                if line.startswith("[tool.poetry.dependencies]") or line.startswith(
-                    "[project.dependencies]"
-                ):
-                    # crude: collect following non-bracket, non-empty lines until next [
-                    continue
-                # naive match for lines like "requests = "^2.0"" or "requests = "2.0"
-                if "=" in line and not line.startswith("["):
-                    key = line.split("=", 1)[0].strip().strip('"')
-                    if key and not key.startswith("_"):
-                        reqs.add(key.lower())
-        except Exception:
-            pass
+    counter = _DefCounter(max_defs)
+    try:
+        counter.visit(tree)
+    except _TooManyDefs:
+        return False, f"size={size_kb:.1f}KB defs>{max_defs} main=True"
 
-    return reqs
+    return True, f"size={size_kb:.1f}KB defs={counter.count} main=True"
 
 
 def get_top_level_imports(repo_root: Path, search_paths: List[Path]) -> Set[str]:
-    imports: Set[str] = set()
-    for p in search_paths:
-        try:
-            src = p.read_text(encoding="utf8")
-        except Exception:
-            continue
-        try:
-            tree = ast.parse(src)
-        except Exception:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for n in node.names:
-                    imports.add(n.name.split(".")[0])
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(node.module.split(".")[0])
-    # filter out stdlib/common local names heuristically
-    stdlib_like = {
-        "os",
-        "sys",
-        "pathlib",
-        "json",
-        "typing",
-        "ast",
-        "subprocess",
-        "shutil",
-        "re",
-        "math",
-        "itertools",
-        "collections",
-        "datetime",
-        "time",
-        "logging",
-        "glob",
-        "inspect",
-        "dataclasses",
+    return {
+        name for name in collect_imports(search_paths) if name not in STDLIB_MODULES
     }
-    return {name for name in imports if name and name not in stdlib_like}
 
 
-def run_compile_check(repo_root: Path) -> List[str]:
-    """Run python -m compileall and return files with syntax errors (if any)."""
+def run_compile_check(
+    repo_root: Path, search_paths: List[Path] | None = None
+) -> List[str]:
+    """Compile each file's cached AST and return one line per file that fails."""
+    if search_paths is None:
+        search_paths = list(iter_py_files(repo_root))
     out = []
-    try:
-        proc = subprocess.run(
-            ["python3", "-m", "compileall", "-q", str(repo_root)],
-            capture_output=True,
-            text=True,
-        )
-        # compileall writes errors to stderr; capture and parse lines with '...' pattern
-        stderr = proc.stderr or proc.stdout
-        for ln in (stderr or "").splitlines():
-            if ln.strip():
-                out.append(ln)
-    except Exception as e:
-        out.append(f"compile-check-failed: {e}")
+    for p in search_paths:
+        try:
+            compile(get_tree(p), str(p), "exec")
+        except (SyntaxError, ValueError) as e:
+            out.append(f"{p.relative_to(repo_root)}: {e}")
+        except OSError:
+            continue
     return out
 
 
@@ -202,11 +150,7 @@ def suggest_actions(repo_root: Path) -> Dict[str, List[str]]:
 
     # dependency check
     declared = parse_requirements(repo_root)
-    search_paths = [
-        p
-        for p in repo_root.rglob("*.py")
-        if "venv" not in str(p) and ".venv" not in str(p)
-    ]
+    search_paths = list(iter_py_files(repo_root))
     imports = get_top_level_imports(repo_root, search_paths)
     missing = sorted([imp for imp in imports if imp.lower() not in declared])
     suggestions["declared_deps"] = sorted(declared)
@@ -214,7 +158,7 @@ def suggest_actions(repo_root: Path) -> Dict[str, List[str]]:
     suggestions["potential_missing_deps"] = missing
 
     # compile check
-    syntax = run_compile_check(repo_root)
+    syntax = run_compile_check(repo_root, search_paths)
     suggestions["compile_issues"] = syntax
 
     return suggestions
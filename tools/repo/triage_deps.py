@@ -9,66 +9,25 @@ Usage: python tools/repo/triage_deps.py
 
 from __future__ import annotations
 
-import ast
 from pathlib import Path
 from typing import Dict, Set
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-
+try:
+    from ._scan import (
+        STDLIB_MODULES,
+        collect_imports,
+        iter_py_files,
+        parse_requirements,
+    )
+except ImportError:  # run as a script: python tools/repo/triage_deps.py
+    from _scan import (
+        STDLIB_MODULES,
+        collect_imports,
+        iter_py_files,
+        parse_requirements,
+    )
 
-def parse_requirements(repo_root: Path) -> Set[str]:
-    reqs = set()
-    for fname in ("requirements.txt", "requirements-min.txt"):
-        f = repo_root / fname
-        if not f.exists():
-            continue
-        for ln in f.read_text(encoding="utf8").splitlines():
-            ln = ln.strip()
-            if not ln or ln.startswith("#"):
-                continue
-            pkg = (
-                ln.split(";")[0].split("==")[0].split("<=")[0].split(">=")[0].split()[0]
-            )
-            pkg = pkg.split("[")[0]
-            if pkg:
-                reqs.add(pkg.lower())
-    # naive pyproject parse
-    pyproject = repo_root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            text = pyproject.read_text(encoding="utf8")
-            for line in text.splitlines():
-                line = line.strip()
-                if "=" in line and not line.startswith("["):
-                    key = line.split("=", 1)[0].strip().strip('"')
-                    if key and not key.startswith("_"):
-                        reqs.add(key.lower())
-        except Exception:
-            pass
-    return reqs
-
-
-def collect_imports(repo_root: Path) -> Set[str]:
-    imports: Set[str] = set()
-    for p in repo_root.rglob("*.py"):
-        if ".venv" in str(p) or "site-packages" in str(p):
-            continue
-        try:
-            src = p.read_text(encoding="utf8")
-        except Exception:
-            continue
-        try:
-            tree = ast.parse(src)
-        except Exception:
-            continue
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for n in node.names:
-                    imports.add(n.name.split(".")[0])
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(node.module.split(".")[0])
-    return imports
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def classify_imports(repo_root: Path, imports: Set[str]) -> Dict[str, str]:
@@ -90,6 +49,8 @@ def classify_imports(repo_root: Path, imports: Set[str]) -> Dict[str, str]:
     for imp in sorted(imports):
         if imp in internal:
             classes[imp] = "internal"
+        elif imp in STDLIB_MODULES:
+            classes[imp] = "stdlib"
         else:
             classes[imp] = "external_candidate"
     return classes
@@ -98,7 +59,7 @@ def classify_imports(repo_root: Path, imports: Set[str]) -> Dict[str, str]:
 def main() -> int:
     repo_root = REPO_ROOT
     declared = parse_requirements(repo_root)
-    imports = collect_imports(repo_root)
+    imports = collect_imports(iter_py_files(repo_root))
     classes = classify_imports(repo_root, imports)
 
     external_candidates = sorted(
@@ -119,7 +80,7 @@ def main() -> int:
         print("  -", m)
 
     print(
-        "\nNote: some names may be stdlib or misclassified; review before adding to requirements."
+        "\nNote: some names may be local modules or misclassified; review before adding to requirements."
     )
     return 0
 
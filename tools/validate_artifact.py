@@ -5,22 +5,97 @@ Validates experiment artifacts against required schemas.
 """
 
 import argparse
+import copy
 import json
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Union
 
 logger = logging.getLogger(__name__)
 
+_SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+
 try:
-    from jsonschema import ValidationError, validate
+    from jsonschema import validators
 
     JSONSCHEMA_AVAILABLE = True
 except Exception:
     JSONSCHEMA_AVAILABLE = False
     logger.warning("jsonschema not available, using basic validation")
 
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except Exception:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+
+def _stdlib_load_json(path: Union[str, Path]) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _stdlib_dumps_json(data: Any) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=1)
+def _json_helpers():
+    """Return ``(load_json, dumps_json)``, importing koriel.io on first use.
+
+    koriel.io pulls in numpy and yaml, so it is not imported at module load;
+    without it the validator falls back to the stdlib json module.
+    """
+    if _SRC_DIR not in sys.path:
+        sys.path.append(_SRC_DIR)
+    try:
+        from koriel.io import dumps_json, load_json
+    except ImportError:
+        return _stdlib_load_json, _stdlib_dumps_json
+    return load_json, dumps_json
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    return _json_helpers()[0](path)
+
+
+def dumps_json(data: Any) -> str:
+    return _json_helpers()[1](data)
+
+
+@lru_cache(maxsize=None)
+def _compiled(schema_path: str):
+    """Compile the schema at ``schema_path`` into a validation function once"""
+    schema = load_json(schema_path)
+
+    # Treat "format" as an annotation, as jsonschema does without a FormatChecker;
+    # run timestamps are naive ISO strings, not strict RFC 3339 date-times.
+    return fastjsonschema.compile(schema, use_formats=False)
+
+
+@lru_cache(maxsize=None)
+def _get_validator(schema_path: str):
+    """Load the schema at ``schema_path`` and build its validator once"""
+    schema = load_json(schema_path)
+
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+# JSON Schema "type" -> Python type(s) accepted by basic_validate_metadata
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
 
 def basic_validate_metadata(
     metadata: Dict[str, Any], schema: Dict[str, Any]
@@ -41,62 +116,81 @@ def basic_validate_metadata(
             expected_type = field_schema.get("type")
             value = metadata[field]
 
-            if expected_type == "string" and not isinstance(value, str):
-                errors.append(
-                    f"Field '{field}' should be string, got {type(value).__name__}"
-                )
-            elif expected_type == "integer" and not isinstance(value, int):
-                errors.append(
-                    f"Field '{field}' should be integer, got {type(value).__name__}"
-                )
-            elif expected_type == "object" and not isinstance(value, dict):
+            # Union types (a list of names) are left to the schema libraries
+            py_type = (
+                _JSON_TYPES.get(expected_type)
+                if isinstance(expected_type, str)
+                else None
+            )
+            if py_type is None:
+                continue
+            # bool subclasses int, but JSON keeps booleans and numbers apart
+            if not isinstance(value, py_type) or (
+                isinstance(value, bool) and expected_type != "boolean"
+            ):
                 errors.append(
-                    f"Field '{field}' should be object, got {type(value).__name__}"
+                    f"Field '{field}' should be {expected_type}, got {type(value).__name__}"
                 )
 
     return errors
 
 
-def validate_metadata(metadata_file: Path, schema_file: Path) -> Dict[str, Any]:
-    """Validate metadata.json against schema"""
+def validate_metadata(
+    metadata_file: Union[Path, Mapping[str, Any]], schema_file: Path
+) -> Dict[str, Any]:
+    """Validate metadata.json (or an already-loaded metadata mapping) against schema"""
+
+    in_memory = isinstance(metadata_file, Mapping)
+    source = "<metadata>" if in_memory else str(metadata_file)
 
-    if not metadata_file.exists():
+    if not in_memory and not metadata_file.exists():
         return {
             "valid": False,
             "errors": [f"Metadata file not found: {metadata_file}"],
-            "file": str(metadata_file),
+            "file": source,
         }
 
     if not schema_file.exists():
         return {
             "valid": False,
             "errors": [f"Schema file not found: {schema_file}"],
-            "file": str(metadata_file),
+            "file": source,
         }
 
     try:
         # Load metadata
-        with open(metadata_file, "r") as f:
-            metadata = json.load(f)
-
-        # Load schema
-        with open(schema_file, "r") as f:
-            schema = json.load(f)
+        if in_memory:
+            metadata = dict(metadata_file)
+        else:
+            metadata = load_json(metadata_file)
 
         # Validate
-        if JSONSCHEMA_AVAILABLE:
+        if FASTJSONSCHEMA_AVAILABLE:
             try:
-                validate(instance=metadata, schema=schema)
+                # fastjsonschema fills schema defaults in place; keep ours intact
+                _compiled(str(schema_file))(copy.deepcopy(metadata))
+                errors = []
+            except fastjsonschema.JsonSchemaValueException as exc:
+                # The compiled validator stops at the first error; re-run with
+                # jsonschema when it is installed to report all of them. The
+                # libraries can disagree, so never let that turn into a pass.
                 errors = []
-            except ValidationError as e:
-                errors = [str(e)]
+                if JSONSCHEMA_AVAILABLE:
+                    validator = _get_validator(str(schema_file))
+                    errors = [str(e) for e in validator.iter_errors(metadata)]
+                if not errors:
+                    errors = [exc.message]
+        elif JSONSCHEMA_AVAILABLE:
+            validator = _get_validator(str(schema_file))
+            errors = [str(e) for e in validator.iter_errors(metadata)]
         else:
+            schema = load_json(schema_file)
             errors = basic_validate_metadata(metadata, schema)
 
         return {
             "valid": len(errors) == 0,
             "errors": errors,
-            "file": str(metadata_file),
+            "file": source,
             "schema": str(schema_file),
             "metadata": metadata,
         }
@@ -105,13 +199,13 @@ def validate_metadata(metadata_file: Path, schema_file: Path) -> Dict[str, Any]:
         return {
             "valid": False,
             "errors": [f"Invalid JSON in {metadata_file}: {e}"],
-            "file": str(metadata_file),
+            "file": source,
         }
     except Exception as e:
         return {
             "valid": False,
             "errors": [f"Validation error: {e}"],
-            "file": str(metadata_file),
+            "file": source,
         }
 
 
@@ -126,8 +220,7 @@ def validate_results(results_file: Path) -> Dict[str, Any]:
         }
 
     try:
-        with open(results_file, "r") as f:
-            results = json.load(f)
+        results = load_json(results_file)
 
         errors = []
 
@@ -185,32 +278,32 @@ def validate_logs(logs_file: Path) -> Dict[str, Any]:
         }
 
     try:
+        # Text mode: universal newlines turn "\r\n" and bare "\r" into "\n"
         with open(logs_file, "r") as f:
             content = f.read()
 
         errors = []
 
+        lines = content.split("\n")
+        log_line_count = sum(1 for line in lines if line.strip())
+
         # Basic checks
-        if len(content.strip()) == 0:
+        if log_line_count == 0:
             errors.append("Logs file is empty")
 
         # Check for basic log structure
-        lines = content.split("\n")
-        log_lines = [line for line in lines if line.strip()]
-
-        if len(log_lines) < 3:
+        if log_line_count < 3:
             errors.append("Logs file appears too short (less than 3 non-empty lines)")
 
         # Check for log levels
-        has_info = any("INFO" in line for line in log_lines)
-        if not has_info:
+        if "INFO" not in content:
             errors.append("No INFO level logs found")
 
         return {
             "valid": len(errors) == 0,
             "errors": errors,
             "file": str(logs_file),
-            "line_count": len(log_lines),
+            "line_count": log_line_count,
             "total_lines": len(lines),
         }
 
@@ -292,11 +385,11 @@ def main():
 
     # Output results
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(results, f, indent=2)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(dumps_json(results))
         print(f"Validation report written to: {args.output}")
     else:
-        print(json.dumps(results, indent=2))
+        print(dumps_json(results))
 
     # Print summary
     print("\nValidation Summary:")